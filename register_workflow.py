@@ -1,41 +1,225 @@
 #!/usr/bin/env python3
 
 import argparse
+import copy
+import functools
+import hashlib
 import json
 import os
 import sys
-import boto3
-from github import Github
-import base64
-import tempfile
-import shutil
-import subprocess
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import time
 import logging
+import threading
+import warnings
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import urlparse
 import re
+import string
+
+# orjson is optional; fall back to the standard library encoder/decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s', stream=sys.stdout)
 logger = logging.getLogger(__name__)
 
+# HTTP session shared by all GitHub REST and GraphQL calls so that one TLS
+# connection to api.github.com is reused. Transient errors and rate limiting
+# are retried with backoff (honoring Retry-After) for GET and PATCH only;
+# POST creates variables and retrying it could fail on an already created one
+github_session = requests.Session()
+github_session.headers.update({"Accept": "application/vnd.github+json"})
+github_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'PATCH']),
+        raise_on_status=False
+    )
+))
+
+# HTTP session shared by all OpenWhisk REST API calls so that connections
+# are reused across actions
+ow_session = requests.Session()
+ow_session.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+ow_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+# Map of FaaSType (lowercased) to the platform its actions are deployed to
+FAAS_ALIAS = {
+    'githubactions': 'github',
+    'github_actions': 'github',
+    'github': 'github',
+    'lambda': 'lambda',
+    'aws_lambda': 'lambda',
+    'aws': 'lambda',
+    'openwhisk': 'openwhisk',
+    'open_whisk': 'openwhisk',
+    'ow': 'openwhisk',
+}
+
+# Credential placeholders in ComputeServers entries, by FaaSType:
+# (config field, placeholder suffix after the server name, credential name)
+SERVER_CREDENTIAL_FIELDS = {
+    'Lambda': (
+        ('AccessKey', '_ACCESS_KEY', 'My_Lambda_Account_ACCESS_KEY'),
+        ('SecretKey', '_SECRET_KEY', 'My_Lambda_Account_SECRET_KEY'),
+    ),
+    'GitHubActions': (
+        ('Token', '_TOKEN', 'My_GitHub_Account_TOKEN'),
+    ),
+    'OpenWhisk': (
+        ('API.key', '_API_KEY', 'My_OW_Account_API_KEY'),
+    ),
+}
+
+# Credential placeholders in the My_Minio_Bucket DataStores entry
+DATASTORE_CREDENTIAL_FIELDS = (
+    ('AccessKey', '_ACCESS_KEY', 'My_Minio_Bucket_ACCESS_KEY'),
+    ('SecretKey', '_SECRET_KEY', 'My_Minio_Bucket_SECRET_KEY'),
+)
+
+# GitHub Actions workflow that runs a FaaSr action in its container; "$$"
+# escapes the "$" of GitHub expressions
+GITHUB_WORKFLOW_TEMPLATE = string.Template("""name: $name
+
+on:
+  workflow_dispatch:
+    inputs:
+      OVERWRITTEN:
+        description: 'overwritten fields'
+        required: true
+      PAYLOAD_URL:
+        description: 'url to payload'
+        required: true
+jobs:
+  run_docker_image:
+    runs-on: ubuntu-latest
+    container: $container_image
+    env:
+      TOKEN: $${{ secrets.My_GitHub_Account_PAT }}
+      My_GitHub_Account_PAT: $${{ secrets.My_GitHub_Account_PAT }}
+      My_S3_Bucket_AccessKey: $${{ secrets.My_S3_Bucket_AccessKey }}
+      My_S3_Bucket_SecretKey: $${{ secrets.My_S3_Bucket_SecretKey }}
+      OVERWRITTEN: $${{ github.event.inputs.OVERWRITTEN }}
+      PAYLOAD_URL: $${{ github.event.inputs.PAYLOAD_URL }}
+    steps:
+    - name: run Python
+      run: |
+        cd /action
+        python3 faasr_entry.py
+""")
+
+# Workflow file types read_workflow_file can parse
+WORKFLOW_FILE_SUFFIXES = ('.json', '.yaml', '.yml')
+
+# Action name with a rank, e.g. func(7)
+RANK_PATTERN = re.compile(r'^([^()]+)\((\d+)\)$')
+
+# Poll a Lambda function's state every 2 seconds for up to 5 minutes
+LAMBDA_WAITER_CONFIG = {'Delay': 2, 'MaxAttempts': 150}
+
+def workflow_file_path(value):
+    """argparse type for --workflow-file: an existing JSON or YAML file"""
+    path = Path(value)
+    if not path.is_file():
+        raise argparse.ArgumentTypeError(f"workflow file {value} not found")
+    if path.suffix.lower() not in WORKFLOW_FILE_SUFFIXES:
+        raise argparse.ArgumentTypeError(
+            f"workflow file {value} must end in one of {', '.join(WORKFLOW_FILE_SUFFIXES)}"
+        )
+    return value
+
+class LoadWorkflowAction(argparse.Action):
+    """Stores the workflow file path and its parsed contents as workflow_data"""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, values)
+        namespace.workflow_data = read_workflow_file(values)
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Deploy FaaSr functions to specified platform')
     parser.add_argument('--workflow-file', required=True,
-                      help='Path to the workflow JSON file')
+                      type=workflow_file_path, action=LoadWorkflowAction,
+                      help='Path to the workflow JSON or YAML file')
     return parser.parse_args()
 
+def json_dumps(data):
+    """Serializes data to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        # Convert non-str dict keys to strings, as json.dumps does
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data)
+
+def json_loads(data):
+    """Parses a JSON string or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def read_workflow_file(file_path):
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        stat = os.stat(file_path)
     except FileNotFoundError:
-        print(f"Error: Workflow file {file_path} not found")
+        logger.error(f"Workflow file {file_path} not found")
         sys.exit(1)
+    return parse_workflow_file(file_path, stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=8)
+def parse_workflow_file(file_path, mtime_ns, size):
+    """
+    Parses a JSON or YAML workflow file. Results are cached, and the file's
+    modification time and size are part of the cache key so that an edited
+    file is parsed again
+
+    Arguments:
+        file_path: path to the workflow file
+        mtime_ns: modification time of the file in nanoseconds
+        size: size of the file in bytes
+    Returns:
+        dict -- workflow data (shared between calls with the same key)
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if os.path.splitext(file_path)[1].lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            logger.error(f"PyYAML is required to read YAML workflow file {file_path}")
+            sys.exit(1)
+        # Use the libyaml-based loader when PyYAML was built with it. Dates
+        # and times are kept as the strings they were written as, since the
+        # workflow is serialized to JSON again for the secret payload
+        class WorkflowLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+            pass
+        WorkflowLoader.add_constructor('tag:yaml.org,2002:timestamp', WorkflowLoader.construct_yaml_str)
+        try:
+            workflow_data = yaml.load(data, Loader=WorkflowLoader)
+        except yaml.YAMLError:
+            workflow_data = None
+        if not isinstance(workflow_data, dict):
+            logger.error(f"Invalid YAML in workflow file {file_path}")
+            sys.exit(1)
+        return workflow_data
+    try:
+        workflow_data = json_loads(data)
     except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in workflow file {file_path}")
+        workflow_data = None
+    if not isinstance(workflow_data, dict):
+        logger.error(f"Invalid JSON in workflow file {file_path}")
         sys.exit(1)
+    return workflow_data
 
 def extract_rank(str_input):
     """
@@ -46,49 +230,28 @@ def extract_rank(str_input):
     Returns:
         (str, int) -- action name and rank
     """
-    parts = str_input.split("(")
-    if len(parts) != 2 or not parts[1].endswith(")"):
+    match = RANK_PATTERN.match(str_input)
+    if match is None:
         return str_input, 1
-    rank = int(parts[1][:-1])
-    action_name = parts[0]
-    return (action_name, rank)
+    return (match.group(1), int(match.group(2)))
 
-def is_cyclic(adj_graph, curr, visited, stack):
+class WorkflowValidationError(Exception):
     """
-    Recursive function that if there is a cycle in a directed
-    graph defined by an adjacency list
-
-    Arguments:
-        adj_graph: adjacency list for graph (dict)
-        curr: current node
-        visited: set of visited nodes (set)
-        stack: list of nodes in recursion call stack (list)
+    Raised by check_dag when the workflow graph is invalid
 
-    Returns:
-        bool: True if cycle exists, False otherwise
+    Attributes:
+        nodes: list of the actions involved
     """
-    # if the current node is in the recursion call
-    # stack then there must be a cycle in the graph
-    if curr in stack:
-        return True
-
-    # add current node to recursion call stack and visited set
-    visited.add(curr)
-    stack.append(curr)
-
-    # check each successor for cycles, recursively calling is_cyclic()
-    for child in adj_graph[curr]:
-        if child not in visited and is_cyclic(adj_graph, child, visited, stack):
-            logger.error(f"Function loop found from node {curr} to {child}")
-            sys.exit(1)
-        elif child in stack:
-            logger.error(f"Function loop found from node {curr} to {child}")
-            sys.exit(1)
 
-    # no more successors to visit for this branch and no cycles found
-    # remove current node from recursion call stack
-    stack.pop()
-    return False
+    def __init__(self, message, nodes=()):
+        super().__init__(message)
+        self.nodes = list(nodes)
+
+class WorkflowCycleError(WorkflowValidationError):
+    """The workflow graph contains a loop; nodes lists it in order"""
+
+class UnreachableStatesError(WorkflowValidationError):
+    """Some actions cannot be reached from the initial action; nodes lists them"""
 
 def build_adjacency_graph(payload):
     """
@@ -105,28 +268,30 @@ def build_adjacency_graph(payload):
     ranks = dict()
 
     # Build adjacency list from ActionList
-    for func in payload["ActionList"].keys():
-        invoke_next = payload["ActionList"][func]["InvokeNext"]
+    for func, action_data in payload["ActionList"].items():
+        invoke_next = action_data["InvokeNext"]
         if isinstance(invoke_next, str):
             invoke_next = [invoke_next]
-        for child in invoke_next:
 
-            def process_action(action):
+        # Conditional branches ({"True": [...], "False": [...]}) contribute
+        # all of their actions as successors
+        successors = []
+        for child in invoke_next:
+            actions = (
+                [action for branch in child.values() for action in branch]
+                if isinstance(child, dict) else [child]
+            )
+            for action in actions:
                 action_name, action_rank = extract_rank(action)
                 if action_name in ranks and ranks[action_name] > 1:
                     err_msg = "Function with rank cannot have multiple predecessors"
-                    logger.error(err_msg)
-                    sys.exit(1)
-                else:
-                    adj_graph[func].append(action_name)
-                    ranks[action_name] = action_rank
+                    raise WorkflowValidationError(f"{err_msg}: {action_name}", [action_name])
+                successors.append(action_name)
+                ranks[action_name] = action_rank
 
-            if isinstance(child, dict):
-                for conditional_branch in child.values():
-                    for action in conditional_branch:
-                        process_action(action)
-            else:
-                process_action(child)
+        # Every action gets an entry, so actions without successors or
+        # predecessors still receive a rank below
+        adj_graph[func] = successors
 
     for func in adj_graph:
         if func not in ranks:
@@ -149,26 +314,23 @@ def predecessors_list(adj_graph):
 def check_dag(faasr_payload):
     """
     This method checks for cycles, repeated function names,
-    or unreachable nodes in the workflow and aborts if it finds any
+    or unreachable nodes in the workflow and raises if it finds any
 
     Arguments:
         payload: FaaSr payload dict
     Returns:
         predecessors: dict -- map of function predecessors
+    Raises:
+        WorkflowCycleError: the graph contains a loop
+        UnreachableStatesError: some actions are unreachable
+        WorkflowValidationError: any other invalid graph
     """
     if faasr_payload["FunctionInvoke"] not in faasr_payload["ActionList"]:
         err_msg = "FunctionInvoke does not refer to a valid function"
-        logger.error(err_msg)
-        sys.exit(1)
+        raise WorkflowValidationError(err_msg, [faasr_payload["FunctionInvoke"]])
 
     adj_graph, ranks = build_adjacency_graph(faasr_payload)
 
-    # Initialize empty recursion call stack
-    stack = []
-
-    # Initialize empty visited set
-    visited = set()
-
     # Find initial function in the graph
     start = False
     for func in faasr_payload["ActionList"]:
@@ -182,18 +344,38 @@ def check_dag(faasr_payload):
 
     # Ensure there is an initial action
     if start is False:
-        logger.error("Function loop found: no initial action")
-        sys.exit(1)
+        raise WorkflowCycleError("Function loop found: no initial action")
 
-    # Check for cycles
-    is_cyclic(adj_graph, first_func, visited, stack)
+    # Check for cycles with an iterative DFS; each node's state is
+    # 0 (unseen), 1 (on the DFS stack) or 2 (done), so a successor in
+    # state 1 closes a loop
+    state = {first_func: 1}
+    work = [(first_func, iter(adj_graph[first_func]))]
+    while work:
+        curr, children = work[-1]
+        for child in children:
+            child_state = state.get(child, 0)
+            if child_state == 1:
+                # the loop runs from child down the DFS stack back to child
+                path = [node for node, _ in work]
+                cycle = path[path.index(child):] + [child]
+                raise WorkflowCycleError(f"Function loop found: {' -> '.join(cycle)}", cycle)
+            if child_state == 0:
+                state[child] = 1
+                work.append((child, iter(adj_graph[child])))
+                break
+        else:
+            # no more successors to visit for this node and no cycles found
+            state[curr] = 2
+            work.pop()
 
     # Check if all of the functions have been visited by the DFS
-    # If not, then there is an unreachable state in the graph
-    for func in faasr_payload["ActionList"]:
-        if func.split(".")[0] not in visited:
-            logger.error(f"Unreachable state found: {func}")
-            sys.exit(1)
+    # If not, then there are unreachable states in the graph
+    action_names = {func.partition(".")[0] for func in faasr_payload["ActionList"]}
+    unreachable = action_names - state.keys()
+    if unreachable:
+        unreachable = sorted(unreachable)
+        raise UnreachableStatesError(f"Unreachable state found: {', '.join(unreachable)}", unreachable)
 
     # Initialize predecessor list
     pre = predecessors_list(adj_graph)
@@ -201,18 +383,55 @@ def check_dag(faasr_payload):
     curr_pre = pre[faasr_payload["FunctionInvoke"]]
     real_pre = []
     for p in curr_pre:
-        if p in ranks and ranks[p] > 1:
-            for i in range(1, ranks[p] + 1):
-                real_pre.append(f"{p}.{i}")
+        rank = ranks.get(p, 0)
+        if rank > 1:
+            real_pre.extend([f"{p}.{i}" for i in range(1, rank + 1)])
         else:
             real_pre.append(p)
     return real_pre
 
+def get_server_platforms(workflow_data):
+    """
+    Resolves the platform each compute server deploys to. FaaSType is
+    matched case-insensitively but left untouched in the workflow, since the
+    payload passes it on to the FaaSr runtime as written
+
+    Arguments:
+        workflow_data: workflow dict
+    Returns:
+        dict -- map of server name to platform in FAAS_ALIAS, or None if the
+        server has no known FaaSType
+    """
+    return {
+        server_name: FAAS_ALIAS.get(str(server_config.get('FaaSType', '')).lower())
+        for server_name, server_config in workflow_data.get('ComputeServers', {}).items()
+    }
+
+def partition_actions(workflow_data, server_platforms):
+    """
+    Groups the workflow's actions by the platform they are deployed to,
+    in a single pass over the ActionList
+
+    Arguments:
+        workflow_data: workflow dict
+        server_platforms: map of server name to platform, from
+            get_server_platforms
+    Returns:
+        dict -- map of platform ('github', 'lambda', 'openwhisk') to a
+        dict of action name: action data
+    """
+    actions = {platform: {} for platform in set(FAAS_ALIAS.values())}
+    for action_name, action_data in workflow_data['ActionList'].items():
+        platform = server_platforms[action_data['FaaSServer']]
+        if platform is not None:
+            actions[platform][action_name] = action_data
+    return actions
+
 def get_github_token():
     # Get GitHub PAT from environment variable
     token = os.getenv('GITHUB_TOKEN')
     if not token:
-        print("Error: GITHUB_TOKEN environment variable not set")
+        logger.error("GITHUB_TOKEN environment variable not set")
         sys.exit(1)
     return token
 
@@ -224,42 +443,153 @@ def get_aws_credentials():
     role_arn = os.getenv('AWS_LAMBDA_ROLE_ARN')
     
     if not all([aws_access_key, aws_secret_key, role_arn]):
-        print("Error: AWS credentials or role ARN not set in environment variables")
+        logger.error("AWS credentials or role ARN not set in environment variables")
         sys.exit(1)
     
     return aws_access_key, aws_secret_key, aws_region, role_arn
 
+def get_github_variable(repo_full_name, var_name, github_token):
+    """
+    Returns the value of a GitHub Actions variable, or None if it is not set
+    """
+    url = f"https://api.github.com/repos/{repo_full_name}/actions/variables/{var_name}"
+    headers = {"Authorization": f"Bearer {github_token}"}
+    r = github_session.get(url, headers=headers)
+    if not r.ok:
+        return None
+    return r.json().get("value")
+
 def set_github_variable(repo_full_name, var_name, var_value, github_token):
     url = f"https://api.github.com/repos/{repo_full_name}/actions/variables/{var_name}"
-    headers = {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": "application/vnd.github+json"
-    }
+    headers = {"Authorization": f"Bearer {github_token}"}
     data = {"name": var_name, "value": var_value}
     # Try to update, if not found, create
-    r = requests.patch(url, headers=headers, json=data)
+    r = github_session.patch(url, headers=headers, json=data)
     if r.status_code == 404:
-        r = requests.post(f"https://api.github.com/repos/{repo_full_name}/actions/variables", headers=headers, json=data)
+        r = github_session.post(f"https://api.github.com/repos/{repo_full_name}/actions/variables", headers=headers, json=data)
     if not r.ok:
-        print(f"Failed to set variable {var_name}: {r.text}")
+        logger.error(f"Failed to set variable {var_name}: {r.text}")
     else:
-        print(f"Set variable {var_name} for {repo_full_name}")
+        logger.info(f"Set variable {var_name} for {repo_full_name}")
+
+def run_parallel(deploy_action, actions, max_workers=8):
+    """
+    Runs deploy_action(action_name, action_data) for each action on a thread
+    pool, since deploying an action is dominated by network I/O
+
+    Arguments:
+        deploy_action: function deploying a single action
+        actions: dict of action name: action data
+        max_workers: upper bound on concurrent deployments
+    """
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(actions))) as executor:
+        futures = [executor.submit(deploy_action, name, data) for name, data in actions.items()]
+        # Surface the first failure (including sys.exit) in the calling thread
+        for future in as_completed(futures):
+            future.result()
+
+def github_graphql(query, github_token):
+    """
+    Runs a query against the GitHub GraphQL API
+
+    Arguments:
+        query: GraphQL query string
+        github_token: GitHub PAT
+    Returns:
+        dict -- the "data" field of the response
+    """
+    headers = {"Authorization": f"Bearer {github_token}"}
+    r = github_session.post("https://api.github.com/graphql", headers=headers, json={"query": query})
+    r.raise_for_status()
+    result = r.json()
+    if result.get("errors"):
+        raise Exception(f"GraphQL query failed: {result['errors']}")
+    return result["data"]
+
+def git_blob_sha(content):
+    """Returns the SHA-1 git assigns to a blob with the given text content"""
+    data = content.encode('utf-8')
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+def get_github_file_shas(repo, branch, paths, github_token):
+    """
+    Looks up the blob SHAs of several files on a repository branch with a
+    single GraphQL query, without downloading their contents
+
+    Arguments:
+        repo: PyGithub repository
+        branch: branch to read the files from
+        paths: list of file paths in the repository
+        github_token: GitHub PAT
+    Returns:
+        dict -- map of path to blob SHA, or None if the file does not exist
+    """
+    if not paths:
+        return {}
+    owner, name = repo.full_name.split("/", 1)
+    fields = "\n".join(
+        f"f{i}: object(expression: {json.dumps(f'{branch}:{path}')}) {{ ... on Blob {{ oid }} }}"
+        for i, path in enumerate(paths)
+    )
+    query = f"query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{\n{fields}\n}} }}"
+    data = github_graphql(query, github_token)["repository"]
+    return {path: data[f"f{i}"] and data[f"f{i}"]["oid"] for i, path in enumerate(paths)}
+
+class Throttle:
+    """Spaces out calls so that at most one starts per interval (in seconds)"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_call = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
 
 def ensure_github_secrets_and_vars(repo, required_secrets, required_vars, github_token):
     """Set GitHub secrets and variables for the repository."""
-    # Check and set secrets
+    # Check and set secrets. The SHA-256 of each uploaded secret is kept in a
+    # <name>_SHA256 variable so that unchanged secrets are not encrypted and
+    # uploaded again
     existing_secrets = {s.name for s in repo.get_secrets()}
     for secret_name, secret_value in required_secrets.items():
+        hash_var_name = f"{secret_name}_SHA256"
+        secret_hash = hashlib.sha256(secret_value.encode('utf-8')).hexdigest()
         if secret_name not in existing_secrets:
-            print(f"Setting secret: {secret_name}")
+            logger.info(f"Setting secret: {secret_name}")
+        elif get_github_variable(repo.full_name, hash_var_name, github_token) == secret_hash:
+            logger.info(f"Secret {secret_name} is already up to date, skipping update")
+            continue
         else:
-            print(f"Secret {secret_name} already exists, updating it.")
+            logger.info(f"Secret {secret_name} already exists, updating it.")
         repo.create_secret(secret_name, secret_value)
+        set_github_variable(repo.full_name, hash_var_name, secret_hash, github_token)
 
     # Set variables using REST API
     for var_name, var_value in required_vars.items():
         set_github_variable(repo.full_name, var_name, var_value, github_token)
 
+def replace_credential_placeholders(config_key, config, fields, credentials):
+    """
+    Replaces placeholder values (e.g. My_Lambda_Account_ACCESS_KEY) in a
+    ComputeServers or DataStores entry with the actual credentials
+
+    Arguments:
+        config_key: name of the server or data store
+        config: server or data store config dict, updated in place
+        fields: tuples of (config field, placeholder suffix, credential name)
+        credentials: dict of credential name: value
+    """
+    for field, suffix, credential_name in fields:
+        value = credentials[credential_name]
+        if value and config.get(field) == config_key + suffix:
+            config[field] = value
+
 def create_secret_payload(workflow_data):
     """
     Create a secret payload that combines all necessary credentials and the complete workflow configuration.
@@ -278,52 +608,29 @@ def create_secret_payload(workflow_data):
     
     payload = credentials.copy()
 
-    # Add workflow data (excluding _workflow_file)
-    workflow_copy = workflow_data.copy()
-    if '_workflow_file' in workflow_copy:
-        del workflow_copy['_workflow_file']
-    payload.update(workflow_copy)
+    # Add workflow data. The copy is deep because the placeholders below are
+    # replaced in place, and the workflow data is shared with deployments to
+    # other platforms running concurrently
+    payload.update(copy.deepcopy(workflow_data))
     
     # Replace placeholder values in ComputeServers with actual credentials
     if 'ComputeServers' in payload:
         for server_key, server_config in payload['ComputeServers'].items():
-            faas_type = server_config.get('FaaSType', '')
-            
-            # Replace placeholder values with actual credentials
-            if faas_type == 'Lambda':
-                # Replace Lambda AccessKey/SecretKey placeholders
-                if 'AccessKey' in server_config and server_config['AccessKey'] == f"{server_key}_ACCESS_KEY":
-                    if credentials['My_Lambda_Account_ACCESS_KEY']:
-                        server_config['AccessKey'] = credentials['My_Lambda_Account_ACCESS_KEY']
-                if 'SecretKey' in server_config and server_config['SecretKey'] == f"{server_key}_SECRET_KEY":
-                    if credentials['My_Lambda_Account_SECRET_KEY']:
-                        server_config['SecretKey'] = credentials['My_Lambda_Account_SECRET_KEY']
-            elif faas_type == 'GitHubActions':
-                # Replace GitHub Token placeholder
-                if 'Token' in server_config and server_config['Token'] == f"{server_key}_TOKEN":
-                    if credentials['My_GitHub_Account_TOKEN']:
-                        server_config['Token'] = credentials['My_GitHub_Account_TOKEN']
-            elif faas_type == 'OpenWhisk':
-                # Replace OpenWhisk API.key placeholder
-                if 'API.key' in server_config and server_config['API.key'] == f"{server_key}_API_KEY":
-                    if credentials['My_OW_Account_API_KEY']:
-                        server_config['API.key'] = credentials['My_OW_Account_API_KEY']
+            fields = SERVER_CREDENTIAL_FIELDS.get(str(server_config.get('FaaSType', '')), ())
+            replace_credential_placeholders(server_key, server_config, fields, credentials)
 
     # Replace placeholder values in DataStores with actual credentials
-    if 'DataStores' in payload:
-        for store_key, store_config in payload['DataStores'].items():
-            # Replace placeholder values with actual credentials
-            if 'AccessKey' in store_config and store_config['AccessKey'] == f"{store_key}_ACCESS_KEY":
-                if store_key == 'My_Minio_Bucket' and credentials['My_Minio_Bucket_ACCESS_KEY']:
-                    store_config['AccessKey'] = credentials['My_Minio_Bucket_ACCESS_KEY']
-            if 'SecretKey' in store_config and store_config['SecretKey'] == f"{store_key}_SECRET_KEY":
-                if store_key == 'My_Minio_Bucket' and credentials['My_Minio_Bucket_SECRET_KEY']:
-                    store_config['SecretKey'] = credentials['My_Minio_Bucket_SECRET_KEY']
+    store_config = payload.get('DataStores', {}).get('My_Minio_Bucket')
+    if store_config is not None:
+        replace_credential_placeholders('My_Minio_Bucket', store_config, DATASTORE_CREDENTIAL_FIELDS, credentials)
     
-    return json.dumps(payload)
+    return json_dumps(payload)
 
-def deploy_to_github(workflow_data):
+def deploy_to_github(workflow_data, github_actions, workflow_file=None):
     """Deploy functions to GitHub Actions."""
+    # Imported here so that deployments to other platforms don't pay for it
+    from github import Github
+
     github_token = get_github_token()
     g = Github(github_token)
     
@@ -334,20 +641,11 @@ def deploy_to_github(workflow_data):
     # Get the current repository
     repo_name = os.getenv('GITHUB_REPOSITORY')
     if not repo_name:
-        print("Error: GITHUB_REPOSITORY environment variable not set")
+        logger.error("GITHUB_REPOSITORY environment variable not set")
         sys.exit(1)
     
-    # Filter actions that should be deployed to GitHub Actions
-    github_actions = {}
-    for action_name, action_data in workflow_data['ActionList'].items():
-        server_name = action_data['FaaSServer']
-        server_config = workflow_data['ComputeServers'][server_name]
-        faas_type = server_config['FaaSType'].lower()
-        if faas_type in ['githubactions', 'github_actions', 'github']:
-            github_actions[action_name] = action_data
-    
     if not github_actions:
-        print("No actions found for GitHub Actions deployment")
+        logger.info("No actions found for GitHub Actions deployment")
         return
     
     try:
@@ -355,16 +653,19 @@ def deploy_to_github(workflow_data):
         
         # Get the default branch name
         default_branch = repo.default_branch
-        print(f"Using branch: {default_branch}")
+        logger.info(f"Using branch: {default_branch}")
         
         # Create secret payload and set up secrets/variables
         secret_payload = create_secret_payload(workflow_data)
         required_secrets = {"SECRET_PAYLOAD": secret_payload}
-        vars = {f"{json_prefix.upper()}_PAYLOAD_REPO": f"{repo_name}/{workflow_data['_workflow_file']}"}
+        vars = {}
+        if workflow_file is not None:
+            vars[f"{json_prefix.upper()}_PAYLOAD_REPO"] = f"{repo_name}/{workflow_file}"
         
         ensure_github_secrets_and_vars(repo, required_secrets, vars, github_token)
         
-        # Deploy each action
+        # Build the workflow file for each action
+        workflow_files = {}
         for action_name, action_data in github_actions.items():
             actual_func_name = action_data['FunctionName']
             
@@ -375,92 +676,117 @@ def deploy_to_github(workflow_data):
             # Get container image, with fallback to default
             container_image = workflow_data.get('ActionContainers', {}).get(action_name, 'ghcr.io/faasr/github-actions-tidyverse')
             
-            workflow_content = f"""name: {prefixed_action_name}
-
-on:
-  workflow_dispatch:
-    inputs:
-      OVERWRITTEN:
-        description: 'overwritten fields'
-        required: true
-      PAYLOAD_URL:
-        description: 'url to payload'
-        required: true
-jobs:
-  run_docker_image:
-    runs-on: ubuntu-latest
-    container: {container_image}
-    env:
-      TOKEN: ${{{{ secrets.My_GitHub_Account_PAT }}}}
-      My_GitHub_Account_PAT: ${{{{ secrets.My_GitHub_Account_PAT }}}}
-      My_S3_Bucket_AccessKey: ${{{{ secrets.My_S3_Bucket_AccessKey }}}}
-      My_S3_Bucket_SecretKey: ${{{{ secrets.My_S3_Bucket_SecretKey }}}}
-      OVERWRITTEN: ${{{{ github.event.inputs.OVERWRITTEN }}}}
-      PAYLOAD_URL: ${{{{ github.event.inputs.PAYLOAD_URL }}}}
-    steps:
-    - name: run Python
-      run: |
-        cd /action
-        python3 faasr_entry.py
-"""
+            workflow_content = GITHUB_WORKFLOW_TEMPLATE.substitute(
+                name=prefixed_action_name,
+                container_image=container_image
+            )
 
-            # Create or update the workflow file
             workflow_path = f".github/workflows/{prefixed_action_name}.yml"
+            workflow_files[workflow_path] = (prefixed_action_name, workflow_content)
+        
+        # Look up every existing workflow file in one request
+        existing_shas = get_github_file_shas(repo, default_branch, list(workflow_files), github_token)
+        
+        # Create or update the workflow files, spacing out the writes to stay
+        # under GitHub's secondary rate limit for content-creating requests.
+        # Writes stay sequential: each one is a commit to the same branch and
+        # concurrent commits conflict
+        throttle = Throttle(1.0)
+        for workflow_path, (prefixed_action_name, workflow_content) in workflow_files.items():
+            existing_sha = existing_shas[workflow_path]
             try:
-                # Try to get the file first
-                contents = repo.get_contents(workflow_path)
-                existing_content = contents.decoded_content.decode('utf-8')
-                
-                # Check if content has changed
-                if existing_content.strip() == workflow_content.strip():
-                    print(f"File {workflow_path} content is already up to date, skipping update")
+                if existing_sha is None:
+                    logger.info(f"File {workflow_path} doesn't exist, creating...")
+                    throttle.wait()
+                    repo.create_file(
+                        path=workflow_path,
+                        message=f"Add workflow for {prefixed_action_name}",
+                        content=workflow_content,
+                        branch=default_branch
+                    )
+                    logger.info(f"Successfully created {workflow_path}")
+                elif existing_sha == git_blob_sha(workflow_content):
+                    logger.info(f"File {workflow_path} content is already up to date, skipping update")
                 else:
                     # If file exists and content is different, update it
-                    print(f"File {workflow_path} exists, updating...")
+                    logger.info(f"File {workflow_path} exists, updating...")
+                    throttle.wait()
                     repo.update_file(
                         path=workflow_path,
                         message=f"Update workflow for {prefixed_action_name}",
                         content=workflow_content,
-                        sha=contents.sha,
+                        sha=existing_sha,
                         branch=default_branch
                     )
-                    print(f"Successfully updated {workflow_path}")
+                    logger.info(f"Successfully updated {workflow_path}")
             except Exception as e:
-                if "Not Found" in str(e) or "404" in str(e):
-                    # If file doesn't exist, create it
-                    print(f"File {workflow_path} doesn't exist, creating...")
-                    repo.create_file(
-                        path=workflow_path,
-                        message=f"Add workflow for {prefixed_action_name}",
-                        content=workflow_content,
-                        branch=default_branch
-                    )
-                    print(f"Successfully created {workflow_path}")
-                else:
-                    print(f"Error updating/creating {workflow_path}: {str(e)}")
-                    # Try to get more details about the error
-                    if hasattr(e, 'data'):
-                        print(f"Error details: {e.data}")
-                    if hasattr(e, 'status'):
-                        print(f"HTTP status: {e.status}")
-                    raise e
+                logger.error(f"Error updating/creating {workflow_path}: {str(e)}")
+                # Try to get more details about the error
+                if hasattr(e, 'data'):
+                    logger.error(f"Error details: {e.data}")
+                if hasattr(e, 'status'):
+                    logger.error(f"HTTP status: {e.status}")
+                raise e
                     
-            print(f"Successfully deployed {prefixed_action_name} to GitHub")
+            logger.info(f"Successfully deployed {prefixed_action_name} to GitHub")
             
     except Exception as e:
-        print(f"Error deploying to GitHub: {str(e)}")
+        logger.error(f"Error deploying to GitHub: {str(e)}")
         sys.exit(1)
 
-def deploy_to_aws(workflow_data):
+def upload_payload_to_s3(s3_client, secret_payload, bucket, key_prefix):
+    """
+    Uploads the secret payload to S3 under a fixed key, overwriting any
+    previous payload. The SHA-256 of the payload is kept in the object
+    metadata so the upload is skipped when the stored payload is unchanged
+
+    Arguments:
+        s3_client: boto3 S3 client
+        secret_payload: JSON payload string
+        bucket: S3 bucket name
+        key_prefix: prefix for the object key
+    Returns:
+        str -- S3 URI of the payload
+    """
+    from botocore.exceptions import ClientError
+
+    body = secret_payload.encode('utf-8')
+    payload_hash = hashlib.sha256(body).hexdigest()
+    key = f"{key_prefix}/payload.json"
+    try:
+        stored = s3_client.head_object(Bucket=bucket, Key=key)
+        if stored.get('Metadata', {}).get('sha256') == payload_hash:
+            logger.info(f"SECRET_PAYLOAD already stored at s3://{bucket}/{key}")
+            return f"s3://{bucket}/{key}"
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('404', 'NoSuchKey', 'NotFound'):
+            raise
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=body,
+        Metadata={'sha256': payload_hash},
+        ServerSideEncryption='AES256'
+    )
+    logger.info(f"Uploaded SECRET_PAYLOAD to s3://{bucket}/{key}")
+    return f"s3://{bucket}/{key}"
+
+def deploy_to_aws(workflow_data, lambda_actions, workflow_file=None):
+    # Imported here so that deployments to other platforms don't pay for
+    # loading boto3 and botocore's service models
+    import boto3
+    from botocore.exceptions import WaiterError
+
     # Get AWS credentials
     aws_access_key, aws_secret_key, aws_region, role_arn = get_aws_credentials()
     
-    lambda_client = boto3.client(
-        'lambda',
+    # One session shares the credentials between the Lambda and S3 clients
+    aws_session = boto3.session.Session(
         aws_access_key_id=aws_access_key,
         aws_secret_access_key=aws_secret_key,
         region_name=aws_region
     )
+    lambda_client = aws_session.client('lambda')
     
     # Get the workflow name for function naming
     workflow_name = workflow_data.get('WorkflowName', 'default')
@@ -469,21 +795,27 @@ def deploy_to_aws(workflow_data):
     # Create secret payload (same as GitHub deployment)
     secret_payload = create_secret_payload(workflow_data)
     
-    # Filter actions that should be deployed to AWS Lambda
-    lambda_actions = {}
-    for action_name, action_data in workflow_data['ActionList'].items():
-        server_name = action_data['FaaSServer']
-        server_config = workflow_data['ComputeServers'][server_name]
-        faas_type = server_config['FaaSType'].lower()
-        if faas_type in ['lambda', 'aws_lambda', 'aws']:
-            lambda_actions[action_name] = action_data
-    
     if not lambda_actions:
-        print("No actions found for AWS Lambda deployment")
+        logger.info("No actions found for AWS Lambda deployment")
         return
     
-    # Process each action in the workflow
-    for action_name, action_data in lambda_actions.items():
+    # Environment variables for Lambda function. The variables are limited to
+    # ~4KB in total, so when a bucket is configured a larger payload is stored
+    # in S3 and the function is given its location instead
+    payload_size = len(secret_payload.encode('utf-8'))
+    payload_bucket = os.getenv('SECRET_PAYLOAD_BUCKET')
+    if payload_size > 4000 and payload_bucket:
+        s3_client = aws_session.client('s3')
+        payload_uri = upload_payload_to_s3(s3_client, secret_payload, payload_bucket, f"faasr-payloads/{json_prefix}")
+        environment_vars = {'SECRET_PAYLOAD_S3_URI': payload_uri}
+    else:
+        if payload_size > 4000:
+            logger.warning(f"SECRET_PAYLOAD size ({payload_size} bytes) may exceed Lambda environment variable limits")
+            logger.warning("Set SECRET_PAYLOAD_BUCKET to store large payloads in S3")
+        environment_vars = {'SECRET_PAYLOAD': secret_payload}
+    
+    # Deploy a single action to AWS Lambda
+    def deploy_action(action_name, action_data):
         try:
             actual_func_name = action_data['FunctionName']
             
@@ -494,23 +826,12 @@ def deploy_to_aws(workflow_data):
             container_image = workflow_data.get('ActionContainers', {}).get(action_name)
             if not container_image:
                 container_image = '145342739029.dkr.ecr.us-east-1.amazonaws.com/aws-lambda-tidyverse:latest'
-                print(f"No container specified for action '{action_name}', using default: {container_image}")
+                logger.info(f"No container specified for action '{action_name}', using default: {container_image}")
  
-            # Check payload size before deployment
-            payload_size = len(secret_payload.encode('utf-8'))
-            if payload_size > 4000:  # Lambda env var limit is ~4KB
-                print(f"Warning: SECRET_PAYLOAD size ({payload_size} bytes) may exceed Lambda environment variable limits")
-                print("Consider using Parameter Store or S3 for large payloads")
-            
-            # Environment variables for Lambda function
-            environment_vars = {
-                'SECRET_PAYLOAD': secret_payload
-            }
-            
             # Check if function already exists first
             try:
-                existing_func = lambda_client.get_function(FunctionName=prefixed_func_name)
-                print(f"Function {prefixed_func_name} already exists, updating...")
+                lambda_client.get_function(FunctionName=prefixed_func_name)
+                logger.info(f"Function {prefixed_func_name} already exists, updating...")
                 # Update existing function
                 lambda_client.update_function_code(
                     FunctionName=prefixed_func_name,
@@ -518,29 +839,14 @@ def deploy_to_aws(workflow_data):
                 )
                 
                 # Wait for the function update to complete
-                print(f"Waiting for {prefixed_func_name} code update to complete...")
-                max_attempts = 60  # Wait up to 5 minutes
-                attempt = 0
-                while attempt < max_attempts:
-                    try:
-                        response = lambda_client.get_function(FunctionName=prefixed_func_name)
-                        state = response['Configuration']['State']
-                        last_update_status = response['Configuration']['LastUpdateStatus']
-                        
-                        if state == 'Active' and last_update_status == 'Successful':
-                            break
-                        elif state == 'Failed' or last_update_status == 'Failed':
-                            sys.exit(1)
-                        else:
-                            time.sleep(5)
-                            attempt += 1
-                    except Exception as e:
-                        print(f"Error checking function state: {str(e)}")
-                        time.sleep(5)
-                        attempt += 1
-                
-                if attempt >= max_attempts:
-                    print(f"Timeout waiting for {prefixed_func_name} update to complete")
+                logger.info(f"Waiting for {prefixed_func_name} code update to complete...")
+                try:
+                    lambda_client.get_waiter('function_updated_v2').wait(
+                        FunctionName=prefixed_func_name,
+                        WaiterConfig=LAMBDA_WAITER_CONFIG
+                    )
+                except WaiterError as e:
+                    logger.error(f"Error waiting for {prefixed_func_name} update to complete: {str(e)}")
                     sys.exit(1)
                 
                 # Now update environment variables
@@ -548,14 +854,14 @@ def deploy_to_aws(workflow_data):
                     FunctionName=prefixed_func_name,
                     Environment={'Variables': environment_vars}
                 )
-                print(f"Successfully updated {prefixed_func_name} on AWS Lambda")
+                logger.info(f"Successfully updated {prefixed_func_name} on AWS Lambda")
                 
             except lambda_client.exceptions.ResourceNotFoundException:
                 # Function doesn't exist, create it
-                print(f"Creating new Lambda function: {prefixed_func_name}")
+                logger.info(f"Creating new Lambda function: {prefixed_func_name}")
                 
                 # Create function with minimal parameters first, then update
-                print("Creating with minimal parameters...")
+                logger.info("Creating with minimal parameters...")
                 try:
                     lambda_client.create_function(
                         FunctionName=prefixed_func_name,
@@ -565,35 +871,19 @@ def deploy_to_aws(workflow_data):
                         Timeout=300,  # Shorter timeout
                         MemorySize=128,  # Minimal memory
                     )
-                    print(f"Successfully created {prefixed_func_name} with minimal parameters")
+                    logger.info(f"Successfully created {prefixed_func_name} with minimal parameters")
                     
                     # Wait for the function to become active before updating
-                    print(f"Waiting for {prefixed_func_name} to become active...")
-                    max_attempts = 60  # Wait up to 5 minutes
-                    attempt = 0
-                    while attempt < max_attempts:
-                        try:
-                            response = lambda_client.get_function(FunctionName=prefixed_func_name)
-                            state = response['Configuration']['State']
-                            
-                            if state == 'Active':
-                                print(f"Function {prefixed_func_name} is now active")
-                                break
-                            elif state == 'Failed':
-                                print(f"Function {prefixed_func_name} creation failed")
-                                sys.exit(1)
-                            else:
-                                print(f"Function state: {state}, waiting...")
-                                time.sleep(5)
-                                attempt += 1
-                        except Exception as e:
-                            print(f"Error checking function state: {str(e)}")
-                            time.sleep(5)
-                            attempt += 1
-                    
-                    if attempt >= max_attempts:
-                        print(f"Timeout waiting for {prefixed_func_name} to become active")
+                    logger.info(f"Waiting for {prefixed_func_name} to become active...")
+                    try:
+                        lambda_client.get_waiter('function_active_v2').wait(
+                            FunctionName=prefixed_func_name,
+                            WaiterConfig=LAMBDA_WAITER_CONFIG
+                        )
+                    except WaiterError as e:
+                        logger.error(f"Error waiting for {prefixed_func_name} to become active: {str(e)}")
                         sys.exit(1)
+                    logger.info(f"Function {prefixed_func_name} is now active")
                     
                     # Now update with full configuration
                     lambda_client.update_function_configuration(
@@ -602,37 +892,62 @@ def deploy_to_aws(workflow_data):
                         MemorySize=1024,
                         Environment={'Variables': environment_vars}
                     )
-                    print(f"Updated {prefixed_func_name} with full configuration")
+                    logger.info(f"Updated {prefixed_func_name} with full configuration")
                     
                 except Exception as minimal_error:
-                    print(f"Minimal creation failed: {minimal_error}")
+                    logger.error(f"Minimal creation failed: {minimal_error}")
                     raise minimal_error
             
         except Exception as e:
-            print(f"Error deploying {prefixed_func_name} to AWS: {str(e)}")
+            logger.error(f"Error deploying {prefixed_func_name} to AWS: {str(e)}")
             # Print additional debugging information
             if "RequestEntityTooLargeException" in str(e):
-                print(f"Payload too large. SECRET_PAYLOAD size: {len(secret_payload)} bytes")
-                print("Consider reducing workflow complexity or using external storage")
+                logger.error(f"Payload too large. SECRET_PAYLOAD size: {len(secret_payload)} bytes")
+                logger.error("Consider reducing workflow complexity or using external storage")
             elif "InvalidParameterValueException" in str(e):
-                print("Check Lambda configuration parameters (memory, timeout, role)")
+                logger.error("Check Lambda configuration parameters (memory, timeout, role)")
             sys.exit(1)
 
+    # Process each action in the workflow
+    run_parallel(deploy_action, lambda_actions)
+
 
 def get_openwhisk_credentials(workflow_data):
     # Get OpenWhisk server configuration from workflow data
     for server_name, server_config in workflow_data['ComputeServers'].items():
-        if server_config['FaaSType'].lower() == 'openwhisk':
+        # YAML workflow files may load these as non-strings (e.g. SSL: true)
+        if str(server_config['FaaSType']).lower() == 'openwhisk':
             return (
                 server_config['Endpoint'],
                 server_config['Namespace'],
-                server_config['SSL'].lower() == 'true'
+                str(server_config['SSL']).lower() == 'true'
             )
     
-    print("Error: No OpenWhisk server configuration found in workflow data")
+    logger.error("No OpenWhisk server configuration found in workflow data")
     sys.exit(1)
 
-def deploy_to_ow(workflow_data):
+def ignore_openwhisk_certificate_warnings(workflow_data):
+    """
+    Silences urllib3's InsecureRequestWarning for the OpenWhisk API host
+    only, since OpenWhisk requests skip certificate verification. Warning
+    filters are process-wide, so this is called once from main before the
+    deployment threads start
+
+    Arguments:
+        workflow_data: workflow dict
+    """
+    api_host, _, _ = get_openwhisk_credentials(workflow_data)
+    if '://' not in api_host:
+        api_host = f"//{api_host}"
+    host = urlparse(api_host).hostname
+    if host:
+        warnings.filterwarnings(
+            'ignore',
+            message=f"Unverified HTTPS request is being made to host '{re.escape(host)}'",
+            category=urllib3.exceptions.InsecureRequestWarning
+        )
+
+def deploy_to_ow(workflow_data, ow_actions, workflow_file=None):
     # Get OpenWhisk credentials
     api_host, namespace, ssl = get_openwhisk_credentials(workflow_data)
     
@@ -640,116 +955,138 @@ def deploy_to_ow(workflow_data):
     workflow_name = workflow_data.get('WorkflowName', 'default')
     json_prefix = workflow_name
     
-    # Filter actions that should be deployed to OpenWhisk
-    ow_actions = {}
-    for action_name, action_data in workflow_data['ActionList'].items():
-        server_name = action_data['FaaSServer']
-        server_config = workflow_data['ComputeServers'][server_name]
-        faas_type = server_config['FaaSType'].lower()
-        if faas_type in ['openwhisk', 'open_whisk', 'ow']:
-            ow_actions[action_name] = action_data
-    
     if not ow_actions:
-        print("No actions found for OpenWhisk deployment")
+        logger.info("No actions found for OpenWhisk deployment")
         return
 
     
-    # Set up wsk properties
-    subprocess.run(f"wsk property set --apihost {api_host}", shell=True)
+    # Build the REST API base URL; the endpoint may be given without a scheme
+    if not api_host.startswith(('http://', 'https://')):
+        api_host = f"{'https' if ssl else 'http'}://{api_host}"
+    actions_url = f"{api_host.rstrip('/')}/api/v1/namespaces/{namespace}/actions"
     
     # Set authentication using API key from environment variable
     ow_api_key = os.getenv('OW_API_KEY')
     if ow_api_key:
-        subprocess.run(f"wsk property set --auth {ow_api_key}", shell=True)
-        print("Using OpenWhisk with API key authentication")
+        ow_session.auth = tuple(ow_api_key.split(':', 1))
+        logger.info("Using OpenWhisk with API key authentication")
     else:
-        print("Using OpenWhisk without authentication")
-    
-    # Always use insecure flag to bypass certificate issues
-    subprocess.run("wsk property set --insecure", shell=True)
+        logger.info("Using OpenWhisk without authentication")
     
-    # Set environment variable to handle certificate issue
-    env = os.environ.copy()
-    env['GODEBUG'] = 'x509ignoreCN=0'
-    
-    # Process each action in the workflow
-    for action_name, action_data in ow_actions.items():
+    # Deploy a single action to OpenWhisk
+    def deploy_action(action_name, action_data):
         try:
             actual_func_name = action_data['FunctionName']
             
             # Create prefixed function name using workflow_name-action_name format
             prefixed_func_name = f"{json_prefix}-{action_name}"
             
-            # Create or update OpenWhisk action using wsk CLI
-            try:
-                # First check if action exists (add --insecure flag)
-                check_cmd = f"wsk action get {prefixed_func_name} --insecure >/dev/null 2>&1"
-                exists = subprocess.run(check_cmd, shell=True, env=env).returncode == 0
-                
-                # Get container image, with fallback to default
-                container_image = workflow_data.get('ActionContainers', {}).get(action_name, 'ghcr.io/faasr/openwhisk-tidyverse')
-                
-                if exists:
-                    # Update existing action (add --insecure flag)
-                    cmd = f"wsk action update {prefixed_func_name} --docker {container_image} --insecure"
-                else:
-                    # Create new action (add --insecure flag)
-                    cmd = f"wsk action create {prefixed_func_name} --docker {container_image} --insecure"
-                
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, env=env)
-                
-                if result.returncode != 0:
-                    raise Exception(f"Failed to {'update' if exists else 'create'} action: {result.stderr}")
-                
-                print(f"Successfully deployed {prefixed_func_name} to OpenWhisk")
-                
-            except Exception as e:
-                print(f"Error deploying {prefixed_func_name} to OpenWhisk: {str(e)}")
-                sys.exit(1)
-                
+            # Get container image, with fallback to default
+            container_image = workflow_data.get('ActionContainers', {}).get(action_name, 'ghcr.io/faasr/openwhisk-tidyverse')
+            
+            # Create or update the OpenWhisk action in a single request
+            # Always skip certificate verification to bypass certificate
+            # issues. It is passed per request because a session-level
+            # verify is overridden by REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE
+            r = ow_session.put(
+                f"{actions_url}/{prefixed_func_name}",
+                params={'overwrite': 'true'},
+                json={'exec': {'kind': 'blackbox', 'image': container_image}},
+                verify=False
+            )
+            if not r.ok:
+                raise Exception(f"Failed to deploy action: {r.text}")
+            
+            logger.info(f"Successfully deployed {prefixed_func_name} to OpenWhisk")
+            
         except Exception as e:
-            print(f"Error processing {prefixed_func_name}: {str(e)}")
+            logger.error(f"Error deploying {prefixed_func_name} to OpenWhisk: {str(e)}")
             sys.exit(1)
 
+    # Process each action in the workflow
+    run_parallel(deploy_action, ow_actions)
+
+# Deployment function for each platform in FAAS_ALIAS, called with the
+# workflow data, the platform's actions and the workflow file path
+DEPLOY_FUNCTIONS = {
+    'github': deploy_to_github,
+    'lambda': deploy_to_aws,
+    'openwhisk': deploy_to_ow,
+}
+
 def main():
+    # The workflow file is validated and parsed while parsing the arguments
     args = parse_arguments()
-    workflow_data = read_workflow_file(args.workflow_file)
-    
-    # Store the workflow file path in the workflow data
-    workflow_data['_workflow_file'] = args.workflow_file
+    workflow_data = args.workflow_data
     
     # Validate workflow for cycles and unreachable states
-    print("Validating workflow for cycles and unreachable states...")
+    logger.info("Validating workflow for cycles and unreachable states...")
     try:
         check_dag(workflow_data)
-        print("✓ Workflow validation passed - no cycles or unreachable states found")
-    except SystemExit:
-        print("✗ Workflow validation failed - check logs for details")
+        logger.info("✓ Workflow validation passed - no cycles or unreachable states found")
+    except WorkflowValidationError as e:
+        logger.error(f"✗ Workflow validation failed - {type(e).__name__}: {str(e)}")
         sys.exit(1)
     
-    # Get all unique FaaSTypes from workflow data
-    faas_types = set()
-    for server in workflow_data.get('ComputeServers', {}).values():
-        if 'FaaSType' in server:
-            faas_types.add(server['FaaSType'].lower())
+    # Resolve each server's platform once, for both finding the platforms to
+    # deploy to and grouping the actions
+    server_platforms = get_server_platforms(workflow_data)
     
-    if not faas_types:
-        print("Error: No FaaSType found in workflow file")
+    # Get all unique platforms from the FaaSTypes in workflow data, in the
+    # order the servers are declared so that deployments are logged in a
+    # reproducible order
+    servers = workflow_data.get('ComputeServers', {})
+    faas_servers = [name for name, server in servers.items() if 'FaaSType' in server]
+    if not faas_servers:
+        logger.error("No FaaSType found in workflow file")
         sys.exit(1)
     
-    print(f"Found FaaS platforms: {', '.join(faas_types)}")
+    for server_name in faas_servers:
+        if server_platforms[server_name] is None:
+            logger.warning(f"Unknown FaaSType '{servers[server_name]['FaaSType']}' - skipping")
+    platforms = list(dict.fromkeys(
+        server_platforms[server_name] for server_name in faas_servers
+        if server_platforms[server_name] is not None
+    ))
     
-    # Deploy to each platform found
-    for faas_type in faas_types:
-        print(f"\nDeploying to {faas_type}...")
-        if faas_type in ['lambda', 'aws_lambda', 'aws']:
-            deploy_to_aws(workflow_data)
-        elif faas_type in ['githubactions', 'github_actions', 'github']:
-            deploy_to_github(workflow_data)
-        elif faas_type in ['openwhisk', 'open_whisk', 'ow']:
-            deploy_to_ow(workflow_data)
-        else:
-            print(f"Warning: Unknown FaaSType '{faas_type}' - skipping")
+    logger.info(f"Found FaaS platforms: {', '.join(platforms)}")
+    
+    # Group the actions by platform once for all deployments
+    actions = partition_actions(workflow_data, server_platforms)
+    
+    # Installed before the deployment threads start, see
+    # ignore_openwhisk_certificate_warnings
+    if 'openwhisk' in platforms:
+        ignore_openwhisk_certificate_warnings(workflow_data)
+    
+    # Deploy to each platform found. The deployments are independent and
+    # mostly wait on the network, so the platforms are deployed concurrently
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(platforms) or 1) as executor:
+        futures = {}
+        for platform in platforms:
+            logger.info(f"Deploying to {platform}...")
+            future = executor.submit(
+                DEPLOY_FUNCTIONS[platform],
+                workflow_data,
+                actions[platform],
+                workflow_file=args.workflow_file
+            )
+            futures[future] = platform
+        for future in as_completed(futures):
+            platform = futures[future]
+            try:
+                future.result()
+                logger.info(f"✓ Deployment to {platform} finished")
+            except SystemExit:
+                logger.error(f"✗ Deployment to {platform} failed - check logs for details")
+                failed.append(platform)
+            except Exception as e:
+                logger.error(f"✗ Deployment to {platform} failed: {str(e)}")
+                failed.append(platform)
+    
+    if failed:
+        sys.exit(1)
     
 
 if __name__ == '__main__':